@@ -5,10 +5,24 @@ league activity reports.
 """
 
 import re
+from datetime import datetime
 from io import StringIO
 from typing import Any
 
-from utils import get_player_headshot_url, get_team_logo_url, is_dst_player, strip_html_tags
+from utils import (CENTRAL_TIME, get_player_headshot_url, get_team_logo_url,
+                   is_dst_player, strip_html_tags)
+
+# Matches HTML tags like <strong> for plain-text extraction.
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Abbreviation of the display timezone (CDT or CST depending on the date),
+# resolved once at import; matches the conversion fmt_local applies to the
+# timestamps shown in the same column.
+_TZ_ABBREV = datetime.now(CENTRAL_TIME).tzname()
+
+# Shared read-only fallback for items without player metadata; avoids
+# allocating a fresh empty dict per row.
+_EMPTY: dict = {}
 
 def _get_email_styles() -> dict[str, str]:
     """Get CSS styles for email rendering - enhanced and email-safe.
@@ -51,6 +65,87 @@ def _get_email_styles() -> dict[str, str]:
     }
 
 
+# Styles are static; build the dict once at import instead of per render/per player.
+_STYLES = _get_email_styles()
+
+# Font-family segment of the h1 style, used by the "No activity" card.
+_H1_FONT_SEG = _STYLES["h1"].split(";")[1]
+
+# Per-row templates with the static style attributes baked in; rows are
+# rendered with one .format() call and combined with a single "".join.
+_ACTIVITY_ROW_TMPL = (
+    f'<tr>'
+    f'<td style="{_STYLES["td"]}; {_STYLES["timestamp"]}">{{when}}</td>'
+    f'<td style="{_STYLES["td"]}; {_STYLES["team_name"]}">{{team}}</td>'
+    f'<td style="{_STYLES["td"]}; {_STYLES["action_text"]}">{{player}}</td>'
+    f'</tr>'
+)
+_DROPPED_ROW_TMPL = f'<tr><td style="{_STYLES["td"]}">{{player_html}}</td></tr>'
+
+# Static table chrome, interpolated once at import; only the section title,
+# item count, and row bodies vary per render.
+_SECTION_H3_TMPL = (
+    f'<h3 style="{_STYLES["h3"]}">{{title}}'
+    f'  <span style="{_STYLES["pill"]}">{{count}}</span></h3>'
+)
+_TBL_OPEN = (
+    f'<div style="{_STYLES["card"]}"><table role="presentation" '
+    f'style="{_STYLES["tbl"]}" cellpadding="0" cellspacing="0">'
+)
+_ALL_ACTIVITY_HEAD = (
+    _TBL_OPEN +
+    f'<thead><tr>'
+    f'<th style="{_STYLES["th"]}">When ({_TZ_ABBREV})</th>'
+    f'<th style="{_STYLES["th"]}">Team</th>'
+    f'<th style="{_STYLES["th"]}">Action</th>'
+    f'</tr></thead><tbody>'
+)
+_DROPPED_TBL_HEAD = _TBL_OPEN + '<tbody>'
+_TBL_FOOT = '</tbody></table></div>'
+
+# Player cell templates: one .format() per player instead of a StringIO
+# and ~10 small writes. Only the image URL and player name vary.
+_PLAYER_TPL_DST = (
+    f'<div style="{_STYLES["player_row"]}">'
+    f'<table role="presentation" style="{_STYLES["media_tbl"]}" cellpadding="0" cellspacing="0">'
+    f'<tr>'
+    f'<td style="{_STYLES["media_img_cell_dst"]}">'
+    f'<img src="{{url}}" alt="{{name}}" style="{_STYLES["team_logo"]}" />'
+    f'</td>'
+    f'<td style="{_STYLES["media_text_cell"]}">'
+    f'<span style="{_STYLES["player_name"]}">{{name}}</span>'
+    f'</td>'
+    f'</tr>'
+    f'</table>'
+    f'</div>'
+)
+_PLAYER_TPL_HEADSHOT = (
+    f'<div style="{_STYLES["player_row"]}">'
+    f'<table role="presentation" style="{_STYLES["media_tbl"]}" cellpadding="0" cellspacing="0">'
+    f'<tr>'
+    f'<td style="{_STYLES["media_img_cell"]}">'
+    f'<img src="{{url}}" alt="{{name}}" style="{_STYLES["headshot"]}" />'
+    f'</td>'
+    f'<td style="{_STYLES["media_text_cell"]}">'
+    f'<span style="{_STYLES["player_name"]}">{{name}}</span>'
+    f'</td>'
+    f'</tr>'
+    f'</table>'
+    f'</div>'
+)
+_PLAYER_TPL_NAME_ONLY = (
+    f'<div style="{_STYLES["player_row"]}">'
+    f'<table role="presentation" style="{_STYLES["media_tbl"]}" cellpadding="0" cellspacing="0">'
+    f'<tr>'
+    f'<td style="{_STYLES["media_text_cell"]}">'
+    f'<span style="{_STYLES["player_name"]}">{{name}}</span>'
+    f'</td>'
+    f'</tr>'
+    f'</table>'
+    f'</div>'
+)
+
+
 def extract_player_info_from_action(action_text: str) -> tuple[str, int | None]:
     """Extract player name and ID from action text.
 
@@ -59,60 +154,23 @@ def extract_player_info_from_action(action_text: str) -> tuple[str, int | None]:
     """
     # This is a simplified extraction - in practice, you'd need to pass
     # the actual player objects with IDs from the main processing
-    player_name = re.sub(r'<[^>]+>', '', action_text)  # Remove HTML tags
+    player_name = _TAG_RE.sub('', action_text)  # Remove HTML tags
     return player_name, None
 
 
 def format_player_with_headshot(player_name: str, player_id: int | None = None,
                                team_abbrev: str = "") -> str:
     """Format player with headshot image for email display (simplified - no redundant info)."""
-    styles = _get_email_styles()
-    output = StringIO()
-
     # Check if this is a D/ST team
     if is_dst_player(player_name) and team_abbrev:
         # Use team logo for D/ST (square)
-        logo_url = get_team_logo_url(team_abbrev)
-        output.write(f'<div style="{styles["player_row"]}">')
-        output.write(f'<table role="presentation" style="{styles["media_tbl"]}" cellpadding="0" cellspacing="0">')
-        output.write(f'<tr>')
-        output.write(f'<td style="{styles["media_img_cell_dst"]}">')
-        output.write(f'<img src="{logo_url}" alt="{player_name}" style="{styles["team_logo"]}" />')
-        output.write(f'</td>')
-        output.write(f'<td style="{styles["media_text_cell"]}">')
-        output.write(f'<span style="{styles["player_name"]}">{player_name}</span>')
-        output.write(f'</td>')
-        output.write(f'</tr>')
-        output.write(f'</table>')
-        output.write(f'</div>')
-    elif player_id:
+        return _PLAYER_TPL_DST.format(url=get_team_logo_url(team_abbrev), name=player_name)
+    if player_id:
         # Use player headshot for regular players
-        headshot_url = get_player_headshot_url(player_id)
-        output.write(f'<div style="{styles["player_row"]}">')
-        output.write(f'<table role="presentation" style="{styles["media_tbl"]}" cellpadding="0" cellspacing="0">')
-        output.write(f'<tr>')
-        output.write(f'<td style="{styles["media_img_cell"]}">')
-        output.write(f'<img src="{headshot_url}" alt="{player_name}" style="{styles["headshot"]}" />')
-        output.write(f'</td>')
-        output.write(f'<td style="{styles["media_text_cell"]}">')
-        output.write(f'<span style="{styles["player_name"]}">{player_name}</span>')
-        output.write(f'</td>')
-        output.write(f'</tr>')
-        output.write(f'</table>')
-        output.write(f'</div>')
-    else:
-        # No image available
-        output.write(f'<div style="{styles["player_row"]}">')
-        output.write(f'<table role="presentation" style="{styles["media_tbl"]}" cellpadding="0" cellspacing="0">')
-        output.write(f'<tr>')
-        output.write(f'<td style="{styles["media_text_cell"]}">')
-        output.write(f'<span style="{styles["player_name"]}">{player_name}</span>')
-        output.write(f'</td>')
-        output.write(f'</tr>')
-        output.write(f'</table>')
-        output.write(f'</div>')
-
-    return output.getvalue()
+        return _PLAYER_TPL_HEADSHOT.format(url=get_player_headshot_url(player_id),
+                                           name=player_name)
+    # No image available
+    return _PLAYER_TPL_NAME_ONLY.format(name=player_name)
 
 
 def render_email_html(grouped: dict[str, list[dict[str, Any]]],
@@ -127,7 +185,7 @@ def render_email_html(grouped: dict[str, list[dict[str, Any]]],
     Returns:
         HTML string for the email content
     """
-    styles = _get_email_styles()
+    styles = _STYLES
 
     def render_dropped_players_by_position(items):
         """Render dropped players grouped by position with enhanced styling."""
@@ -136,27 +194,18 @@ def render_email_html(grouped: dict[str, list[dict[str, Any]]],
 
         # Group dropped players by position
         position_groups = {}
+        _strip_tags = strip_html_tags
         for i in items:
             # Extract dropped player information from the new data structure
-            dropped_player_info = i.get('dropped_player', {})
+            dropped_player_info = i.get('dropped_player') or _EMPTY
             dropped_player_name = dropped_player_info.get('name', '')
             dropped_player_position = dropped_player_info.get('position', '')
             dropped_player_id = dropped_player_info.get('player_id')
 
-            # If no dropped player info in new structure, fall back to parsing action text
+            # main.py attaches dropped_player metadata to every drop item, so
+            # this is purely a defensive fallback for malformed items
             if not dropped_player_name:
-                action_text = strip_html_tags(i['player'])
-                if ("Dropped" in action_text and
-                        ("for" in action_text or "to claim" in action_text)):
-                    # Extract the dropped player name (first player in
-                    # "Dropped Player A for/to claim Player B")
-                    dropped_player_name = (action_text.split("Dropped ")[1]
-                                         .split(" for ")[0].split(" to claim ")[0])
-                elif "Dropped" in action_text:
-                    # Extract the dropped player name (from "Dropped Player A")
-                    dropped_player_name = action_text.split("Dropped ")[1]
-                else:
-                    dropped_player_name = action_text
+                dropped_player_name = _strip_tags(i['player'])
 
             # If we still don't have position info, try to extract from the formatted player name
             if not dropped_player_position and dropped_player_name:
@@ -183,104 +232,77 @@ def render_email_html(grouped: dict[str, list[dict[str, Any]]],
                 'item': i
             })
 
-        # Define the preferred order for positions
+        # Define the preferred order for positions; any positions not in the
+        # preferred order follow alphabetically (fallback for future positions)
         position_order = ['QB', 'RB', 'WR', 'TE', 'D/ST', 'K']
-        
-        # Render tables for each position in the specified order
+        ordered_positions = ([p for p in position_order if p in position_groups] +
+                             [p for p in sorted(position_groups) if p not in position_order])
+
+        # Render one table per position
         output = StringIO()
-        for position in position_order:
-            if position in position_groups:
-                players = position_groups[position]
-                output.write(f'<h3 style="{styles["h3"]}">Dropped {position}s')
-                output.write(f'  <span style="{styles["pill"]}">{len(players)}</span></h3>')
-                output.write(f'<div style="{styles["card"]}"><table role="presentation" ')
-                output.write(f'style="{styles["tbl"]}" cellpadding="0" cellspacing="0">')
-                output.write(f'<tbody>')
-
-                for player_data in players:
-                    # Format player with headshot
-                    player_html = format_player_with_headshot(
-                        player_data['name'], 
-                        player_data['id'], 
-                        player_data['pro_team']
-                    )
-                    output.write(f'<tr><td style="{styles["td"]}">{player_html}</td></tr>')
-
-                output.write(f'</tbody></table></div>')
-        
-        # Handle any positions not in the preferred order (fallback for future positions)
-        for position in sorted(position_groups.keys()):
-            if position not in position_order:
-                players = position_groups[position]
-                output.write(f'<h3 style="{styles["h3"]}">Dropped {position}s')
-                output.write(f'  <span style="{styles["pill"]}">{len(players)}</span></h3>')
-                output.write(f'<div style="{styles["card"]}"><table role="presentation" ')
-                output.write(f'style="{styles["tbl"]}" cellpadding="0" cellspacing="0">')
-                output.write(f'<tbody>')
-
-                for player_data in players:
-                    # Format player with headshot
-                    player_html = format_player_with_headshot(
-                        player_data['name'], 
-                        player_data['id'], 
-                        player_data['pro_team']
-                    )
-                    output.write(f'<tr><td style="{styles["td"]}">{player_html}</td></tr>')
-
-                output.write(f'</tbody></table></div>')
+        for position in ordered_positions:
+            players = position_groups[position]
+            output.write(_SECTION_H3_TMPL.format(title=f'Dropped {position}s',
+                                                 count=len(players)))
+            output.write(_DROPPED_TBL_HEAD)
+
+            output.write("".join(
+                _DROPPED_ROW_TMPL.format(player_html=format_player_with_headshot(
+                    player_data['name'],
+                    player_data['id'],
+                    player_data['pro_team']
+                ))
+                for player_data in players
+            ))
+
+            output.write(_TBL_FOOT)
 
         return output.getvalue()
 
-    def render_all_activity_table(items):
-        """Render a single combined table with all actions sorted by time with enhanced styling."""
-        if not items:
+    def render_all_activity_table(rows_html, count):
+        """Render the combined all-activity table from pre-rendered row HTML."""
+        if not count:
             return ""
 
         output = StringIO()
-        output.write(f'<h3 style="{styles["h3"]}">All Activity')
-        output.write(f'  <span style="{styles["pill"]}">{len(items)}</span></h3>')
-        output.write(f'<div style="{styles["card"]}"><table role="presentation" ')
-        output.write(f'style="{styles["tbl"]}" cellpadding="0" cellspacing="0">')
-        output.write(f'<thead><tr>')
-        output.write(f'<th style="{styles["th"]}">When (CDT)</th>')
-        output.write(f'<th style="{styles["th"]}">Team</th>')
-        output.write(f'<th style="{styles["th"]}">Action</th>')
-        output.write(f'</tr></thead><tbody>')
-
-        for i in items:
-            # Enhanced row with better styling
-            output.write(f'<tr>')
-            output.write(f'<td style="{styles["td"]}; {styles["timestamp"]}">{i["when_local"]}</td>')
-            output.write(f'<td style="{styles["td"]}; {styles["team_name"]}">{i["team"]}</td>')
-            output.write(f'<td style="{styles["td"]}; {styles["action_text"]}">{i["player"]}</td>')
-            output.write(f'</tr>')
-
-        output.write(f'</tbody></table></div>')
+        output.write(_SECTION_H3_TMPL.format(title='All Activity', count=count))
+        output.write(_ALL_ACTIVITY_HEAD)
+        output.write(rows_html)
+        output.write(_TBL_FOOT)
         return output.getvalue()
 
     # Get all combined actions (already sorted by main.py)
     all_actions = grouped.get("Combined", [])
 
-    # Get dropped players for the separate table
-    dropped_players = [action for action in all_actions if "Dropped" in action.get("player", "")]
+    # Single pass: render each activity row and collect dropped players
+    # for the separate per-position tables.
+    activity_rows = []
+    dropped_players = []
+    for action in all_actions:
+        player = action.get("player", "")
+        activity_rows.append(_ACTIVITY_ROW_TMPL.format(
+            when=action["when_local"], team=action["team"], player=player))
+        if "Dropped" in player:
+            dropped_players.append(action)
 
-    output = StringIO()
-    output.write(f'<!doctype html><meta charset="utf-8">')
-    output.write(f'<div style="{styles["wrap"]}">')
-    output.write(f'<h1 style="{styles["h1"]}">Digest for {league_title}</h1>')
-    output.write(f'<h2 style="{styles["h2"]}">{window_desc}</h2>')
+    body_parts = []
 
     # Add Players Dropped tables grouped by position if there are any
     if dropped_players:
-        output.write(render_dropped_players_by_position(dropped_players))
+        body_parts.append(render_dropped_players_by_position(dropped_players))
 
     # Add All Activity table
     if not all_actions:
-        output.write(f'<div style="{styles["card"]};padding:14px 16px;'
-                    f'{styles["h1"].split(";")[1]}">'
-                    f'No activity {window_desc}.</div>')
+        body_parts.append(f'<div style="{styles["card"]};padding:14px 16px;'
+                          f'{_H1_FONT_SEG}">'
+                          f'No activity {window_desc}.</div>')
     else:
-        output.write(render_all_activity_table(all_actions))
-
-    output.write(f'</div>')
-    return output.getvalue()
+        body_parts.append(render_all_activity_table("".join(activity_rows), len(all_actions)))
+
+    # Assemble the document in one string build instead of StringIO writes
+    return (f'<!doctype html><meta charset="utf-8">'
+            f'<div style="{styles["wrap"]}">'
+            f'<h1 style="{styles["h1"]}">Digest for {league_title}</h1>'
+            f'<h2 style="{styles["h2"]}">{window_desc}</h2>'
+            f'{"".join(body_parts)}'
+            f'</div>')
@@ -6,19 +6,29 @@ football league activity reports.
 
 import base64
 import json
-from email.mime.text import MIMEText
+from email.header import Header
 from typing import Any
 
 from dotenv import load_dotenv
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 
 from utils import get_env
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.send"]
 load_dotenv()  # pulls EMAIL_* from .env
 
+# Cached Gmail service and its credentials; rebuilt only when the
+# credentials go invalid.
+_service = None
+_service_creds = None
+
+# Parsed (from_addr, to, cc, bcc) tuple; env vars don't change during the
+# process lifetime, so resolve them once on first send.
+_recipients = None
+
+# Static header block (everything but Subject and the body), built once;
+# only the subject line and encoded body vary between sends.
+_header_prefix = None
+
 def _parse_list(env_value: str | None) -> list[str]:
     """Parse comma or semicolon separated email addresses from environment variable.
 
@@ -33,6 +43,12 @@ def _parse_list(env_value: str | None) -> list[str]:
     parts = [p.strip() for p in env_value.replace(";", ",").split(",")]
     return [p for p in parts if p]
 
+def _encode_header(value: str) -> str:
+    """RFC 2047-encode a header value only when it contains non-ASCII text."""
+    if value.isascii():
+        return value
+    return Header(value, "utf-8").encode()
+
 def _get_service():
     """Get authenticated Gmail service instance.
 
@@ -42,6 +58,19 @@ def _get_service():
     Raises:
         ValueError: If token is missing or invalid
     """
+    # Imported here so that runs which never send (debug/preview) skip the
+    # heavy Google client import chain at startup.
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build
+
+    global _service, _service_creds
+
+    # Reuse the cached service while its credentials are still valid;
+    # build() re-reads the discovery document and is expensive.
+    if _service is not None and _service_creds is not None and _service_creds.valid:
+        return _service
+
     # Read token from environment variable (base64 encoded)
     token_b64 = get_env("GMAIL_TOKEN_B64")
 
@@ -63,7 +92,24 @@ def _get_service():
             # This shouldn't happen in GitHub Actions if token is valid
             raise ValueError("Invalid or expired token and no refresh token available")
 
-    return build("gmail", "v1", credentials=creds)
+    # static_discovery uses the bundled discovery document instead of an
+    # HTTP round-trip to fetch it
+    _service = build("gmail", "v1", credentials=creds,
+                     cache_discovery=False, static_discovery=True)
+    _service_creds = creds
+    return _service
+
+def warm_service() -> None:
+    """Build and cache the Gmail service ahead of the actual send.
+
+    Intended to run on a worker thread while other network I/O (the ESPN
+    fetch) is in flight. Failures are swallowed here; _get_service caches
+    only on success, so the real send rebuilds and raises the actual error.
+    """
+    try:
+        _get_service()
+    except Exception:  # pylint: disable=broad-except
+        pass
 
 def send_gmail_html(subject: str, html: str) -> None:
     """Send HTML email via Gmail API.
@@ -75,25 +121,42 @@ def send_gmail_html(subject: str, html: str) -> None:
     Raises:
         ValueError: If no recipients are specified or service fails
     """
-    from_addr = get_env("EMAIL_FROM")
-    to_list = _parse_list(get_env("EMAIL_TO", required=False, default="")) or []
-    cc_list = _parse_list(get_env("EMAIL_CC", required=False, default="")) or []
-    bcc_list = _parse_list(get_env("EMAIL_BCC", required=False, default="")) or []
+    global _recipients, _header_prefix
+    if _recipients is None:
+        _recipients = (
+            get_env("EMAIL_FROM"),
+            _parse_list(get_env("EMAIL_TO", required=False, default="")),
+            _parse_list(get_env("EMAIL_CC", required=False, default="")),
+            _parse_list(get_env("EMAIL_BCC", required=False, default="")),
+        )
+    from_addr, to_list, cc_list, bcc_list = _recipients
 
     if not to_list and not bcc_list:
         raise ValueError("Need at least one recipient in TO or BCC.")
 
-    msg = MIMEText(html, "html")
-    if to_list:
-        msg["To"] = ", ".join(to_list)
-    if cc_list:
-        msg["Cc"] = ", ".join(cc_list)
-    if bcc_list:
-        msg["Bcc"] = ", ".join(bcc_list)
-    msg["Subject"] = subject
-    msg["From"] = from_addr or (to_list[0] if to_list else "")
-
-    raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
+    # Build the RFC 822 message directly: for a single-part HTML body the
+    # email.generator machinery (header folding, payload encoding passes)
+    # is unnecessary overhead. Everything but Subject is static per process.
+    if _header_prefix is None:
+        headers = []
+        if to_list:
+            headers.append(f"To: {', '.join(to_list)}")
+        if cc_list:
+            headers.append(f"Cc: {', '.join(cc_list)}")
+        if bcc_list:
+            headers.append(f"Bcc: {', '.join(bcc_list)}")
+        headers.append(f"From: {from_addr or (to_list[0] if to_list else '')}")
+        headers.append("MIME-Version: 1.0")
+        headers.append('Content-Type: text/html; charset="utf-8"')
+        headers.append("Content-Transfer-Encoding: base64")
+        _header_prefix = ("\r\n".join(headers) + "\r\n").encode("utf-8")
+
+    # b64encode is a single C call; the Gmail API accepts the unfolded body
+    # line, so skip encodebytes' Python-level 76-column chunking.
+    raw_bytes = (_header_prefix
+                 + f"Subject: {_encode_header(subject)}\r\n\r\n".encode("utf-8")
+                 + base64.b64encode(html.encode("utf-8")))
+    raw = base64.urlsafe_b64encode(raw_bytes).decode()
     svc = _get_service()
     # pylint: disable=no-member
     svc.users().messages().send(userId="me", body={"raw": raw}).execute()
@@ -5,25 +5,28 @@ This script fetches recent activity from an ESPN Fantasy Football league
 and generates an HTML report showing trades, adds, drops, and other transactions.
 """
 
+import hashlib
+import pickle
 import time
-import webbrowser
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from dotenv import load_dotenv
-from espn_api.football import League
 
 from email_render import render_email_html
-from gmail_send import send_gmail_html
-from utils import CENTRAL_TIME, debug, fmt_local, fmt_player, fmt_team, get_env
+from utils import (CENTRAL_TIME, debug, debug_verbose, fmt_local, fmt_player,
+                   fmt_team, get_env)
 
-load_dotenv()
 
-
-@dataclass
+@dataclass(slots=True)
 class PlayerInfo:
     """Player information for activity tracking."""
     player_id: int | None = None
@@ -31,7 +34,7 @@ class PlayerInfo:
     pro_team: str = ""
     name: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ActivityItem:
     """Activity item for fantasy football transactions."""
     when_utc: datetime
@@ -40,6 +43,7 @@ class ActivityItem:
     action: str
     bid: int
     action_type: str
+    is_waiver_add: bool = False
     player_id: int | None = None
     position: str = ""
     pro_team: str = ""
@@ -48,56 +52,72 @@ class ActivityItem:
 
 # ---------- utils ----------
 
-def _extract_player_info(player_obj: Any) -> dict[str, Any]:
+def _extract_player_info(player_obj: Any) -> PlayerInfo:
     """Extract standardized player information from player object.
 
     Args:
         player_obj: Player object from ESPN API
 
     Returns:
-        Dictionary with player_id, position, pro_team, and name
+        PlayerInfo with player_id, position, pro_team, and name
     """
     if not player_obj:
-        return {
-            "player_id": None,
-            "position": "",
-            "pro_team": "",
-            "name": ""
-        }
+        return PlayerInfo()
+
+    # espn_api Player keeps everything in the instance __dict__, so read it
+    # directly and skip four __getattribute__ fallback walks per action
+    d = getattr(player_obj, "__dict__", None)
+    if d is not None:
+        return PlayerInfo(
+            player_id=d.get("playerId"),
+            position=d.get("position", ""),
+            pro_team=d.get("proTeam", ""),
+            name=d["name"] if "name" in d else str(player_obj),
+        )
 
-    return {
-        "player_id": getattr(player_obj, "playerId", None),
-        "position": getattr(player_obj, "position", ""),
-        "pro_team": getattr(player_obj, "proTeam", ""),
-        "name": getattr(player_obj, "name", str(player_obj))
-    }
+    return PlayerInfo(
+        player_id=getattr(player_obj, "playerId", None),
+        position=getattr(player_obj, "position", ""),
+        pro_team=getattr(player_obj, "proTeam", ""),
+        name=getattr(player_obj, "name", str(player_obj)),
+    )
 
-def _extract_player_info_from_dict(item: dict[str, Any]) -> dict[str, Any]:
-    """Extract player information from activity item dictionary.
+def _extract_player_info_from_item(item: ActivityItem) -> dict[str, Any]:
+    """Extract renderer-ready player information from an activity item.
 
     Args:
-        item: Activity item dictionary
+        item: Working activity item
 
     Returns:
-        Dictionary with player_id, position, pro_team, and name
+        Dictionary with player_id, position, pro_team, and name (the
+        renderer consumes plain dicts at the boundary)
     """
+    # item.player is raw fmt_player output; <strong> markup is only added
+    # later when combined action text is built, so no stripping is needed
     return {
-        "player_id": item.get("player_id"),
-        "position": item.get("position", ""),
-        "pro_team": item.get("pro_team", ""),
-        "name": item.get("player", "").replace("<strong>", "").replace("</strong>", "")
+        "player_id": item.player_id,
+        "position": item.position,
+        "pro_team": item.pro_team,
+        "name": item.player
     }
 
-def league_handle() -> League:
+# League construction re-hits ESPN auth; the config env vars don't change
+# during the process lifetime, so one instance serves repeat callers.
+@lru_cache(maxsize=1)
+def league_handle() -> "League":
     """Create and return a League instance using environment variables.
 
     Returns:
-        Configured League instance
+        Configured League instance (cached after the first call)
 
     Raises:
         RuntimeError: If required environment variables are missing
         ValueError: If league_id or year cannot be converted to int
     """
+    # espn_api pulls in requests and friends; import it only when a League
+    # is actually constructed so importing this module stays cheap
+    from espn_api.football import League
+
     try:
         return League(
             league_id=int(get_env("LEAGUE_ID")),
@@ -115,8 +135,22 @@ def normalize_action_tuple(t: Any) -> tuple[Any, str, Any, Any]:
         t: Action data from ESPN API (list, tuple, dict, or other)
 
     Returns:
-        Tuple of (team, action, player, bid) with normalized action text
+        Tuple of (team, action, player, bid). The action text is lowercased
+        here; downstream consumers rely on that and must not re-lower.
     """
+    # ESPN returns plain tuples for effectively every action, so check the
+    # exact type first and skip the str() round-trip when the action text
+    # is already a string; isinstance below still catches subclasses.
+    tt = type(t)
+    if (tt is tuple or tt is list) and len(t) >= 3:
+        action = t[1]
+        return (
+            t[0],
+            action.lower() if type(action) is str else str(action).lower(),
+            t[2],
+            t[3] if len(t) >= 4 else None,
+        )
+
     if isinstance(t, (list, tuple)) and len(t) >= 3:
         team, action, player = t[0], t[1], t[2]
         bid = t[3] if len(t) >= 4 else None
@@ -132,56 +166,96 @@ def normalize_action_tuple(t: Any) -> tuple[Any, str, Any, Any]:
 
     return None, str(t).lower(), t, None
 
+# Keyword -> category rules for classify_action, in priority order: "waiver
+# added" must classify as Adds, so "add" has to be tested before "waiver".
+# "trade"/"drop" also cover "traded"/"dropped".
+_CATEGORY_RULES = (
+    ("trade", "Trades"),
+    ("drop", "Drops"),
+    ("add", "Adds"),
+    ("waiver", "Waivers"),
+    ("claim", "Waivers"),
+    ("move", "Roster Moves"),
+    ("activated", "Roster Moves"),
+    ("reserve", "Roster Moves"),
+)
+
+# Action texts repeat heavily across a fetch ("waiver added", "dropped",
+# ...), so repeated strings become a single dict lookup.
+@lru_cache(maxsize=256)
 def classify_action(action_text: str) -> str:
     """Classify ESPN action text into categories.
 
     Args:
-        action_text: Raw action text from ESPN API
+        action_text: Action text, already lowercased by normalize_action_tuple
 
     Returns:
         Category string: "Trades", "Drops", "Adds", "Waivers", "Roster Moves", or "Other"
     """
-    action_lower = action_text.lower()
-
-    # Use match statement for cleaner pattern matching
-    match action_lower:
-        case action if "trade" in action or "traded" in action:
-            return "Trades"
-        case action if "drop" in action or "dropped" in action:
-            return "Drops"
-        case action if "add" in action:
-            return "Adds"
-        case action if "waiver" in action or "claim" in action:
-            return "Waivers"
-        case action if any(word in action for word in ("move", "activated", "reserve")):
-            return "Roster Moves"
-        case _:
-            return "Other"
+    for keyword, category in _CATEGORY_RULES:
+        if keyword in action_text:
+            return category
+    return "Other"
 
 
-def format_individual_action(item: dict[str, Any]) -> str:
+def format_individual_action(item: ActivityItem) -> str:
     """Format individual action text with proper styling."""
-    action_type = item["action_type"]
-    action_text = item["action"].lower()
-    player = item["player"]
-    bid = item["bid"]
+    player = item.player
 
-    match action_type:
+    match item.action_type:
         case "Adds":
-            if "waiver added" in action_text:
-                return f"Claimed <strong>{player}</strong> for ${bid}"
+            if item.is_waiver_add:
+                return f"Claimed <strong>{player}</strong> for ${item.bid}"
             return f"Added <strong>{player}</strong>"
         case "Drops":
             return f"Dropped <strong>{player}</strong>"
         case _:
             # Check if it's a waiver claim that wasn't classified as "Adds"
-            if "waiver added" in action_text:
-                return f"Claimed <strong>{player}</strong> for ${bid}"
-            return item["action"]
+            if item.is_waiver_add:
+                return f"Claimed <strong>{player}</strong> for ${item.bid}"
+            return item.action
+
+# C-level sort keys for the final activity ordering (see get_activity_since)
+_SORT_WHEN = itemgetter("when_utc")
+_SORT_BID = itemgetter("bid")
+_SORT_TIEBREAK = itemgetter("team", "player")
+
+# Read-only "other side" of a one-sided action; the renderer only reads
+# these fields, so every item shares the one immutable mapping.
+_EMPTY_PLAYER = MappingProxyType(
+    {"player_id": None, "position": "", "pro_team": "", "name": ""})
+
+def _make_individual_combined(item: ActivityItem, is_drop: bool | None = None) -> dict[str, Any]:
+    """Build a Combined entry for a lone add, drop, or other action.
+
+    Args:
+        item: Working activity item
+        is_drop: Whether the action is a drop; derived from the action text
+            when not supplied by the caller
+
+    Returns:
+        Combined action item with added/dropped player metadata
+    """
+    formatted_action = format_individual_action(item)
+    if is_drop is None:
+        is_drop = "Dropped" in formatted_action or "drop" in item.action
+
+    player_info = _extract_player_info_from_item(item)
+    return {
+        "when_utc": item.when_utc,
+        "team": item.team,
+        "player": formatted_action,
+        "bid": item.bid,
+        "action_type": "Combined",
+        "added_player": _EMPTY_PLAYER if is_drop else player_info,
+        "dropped_player": player_info if is_drop else _EMPTY_PLAYER,
+    }
 
 # ---------- fetch ----------
-def _process_activity_actions(actions: list[Any],
-                             ts_utc: datetime) -> dict[str, list[dict[str, Any]]]:
+def _process_activity_actions(
+    actions: list[Any],
+    ts_utc: datetime,
+) -> tuple[list[ActivityItem], list[ActivityItem], list[ActivityItem], list[ActivityItem]]:
     """Process actions within a single activity and categorize them.
 
     Args:
@@ -189,13 +263,19 @@ def _process_activity_actions(actions: list[Any],
         ts_utc: UTC timestamp for the activity
 
     Returns:
-        Dictionary with categorized actions
+        Tuple of (adds, drops, trades, other) action lists
     """
     adds = []
     drops = []
     trades = []
     other_actions = []
 
+    # Actions in one activity frequently share team/player objects (an
+    # add+drop names the same team twice), so format each object once.
+    # id() keys are safe here because the objects outlive the loop.
+    team_cache: dict[int, str] = {}
+    player_cache: dict[int, str] = {}
+
     for tup in actions:
         team_obj, action_text, player_obj, bid = normalize_action_tuple(tup)
         action_type = classify_action(action_text)
@@ -203,15 +283,28 @@ def _process_activity_actions(actions: list[Any],
         # Extract player details for headshot support
         player_info = _extract_player_info(player_obj)
 
-        activity_item = {
-            "when_utc": ts_utc,
-            "team": fmt_team(team_obj),
-            "player": fmt_player(player_obj),
-            "action": action_text,
-            "bid": bid or 0,
-            "action_type": action_type,
-            **player_info
-        }
+        team_key = id(team_obj)
+        team_fmt = team_cache.get(team_key)
+        if team_fmt is None:
+            team_fmt = team_cache[team_key] = fmt_team(team_obj)
+
+        player_key = id(player_obj)
+        player_fmt = player_cache.get(player_key)
+        if player_fmt is None:
+            player_fmt = player_cache[player_key] = fmt_player(player_obj)
+
+        activity_item = ActivityItem(
+            when_utc=ts_utc,
+            team=team_fmt,
+            player=player_fmt,
+            action=action_text,
+            bid=int(bid) if bid else 0,
+            action_type=action_type,
+            is_waiver_add="waiver added" in action_text,
+            player_id=player_info.player_id,
+            position=player_info.position,
+            pro_team=player_info.pro_team,
+        )
 
         # Categorize the action
         if action_type == "Adds":
@@ -223,16 +316,11 @@ def _process_activity_actions(actions: list[Any],
         else:
             other_actions.append(activity_item)
 
-    return {
-        "adds": adds,
-        "drops": drops,
-        "trades": trades,
-        "other": other_actions
-    }
+    return adds, drops, trades, other_actions
 
 
-def _process_add_drop_combinations(adds: list[dict[str, Any]],
-                                  drops: list[dict[str, Any]],
+def _process_add_drop_combinations(adds: list[ActivityItem],
+                                  drops: list[ActivityItem],
                                   ts_utc: datetime) -> list[dict[str, Any]]:
     """Process add/drop combinations and return combined items.
 
@@ -245,93 +333,52 @@ def _process_add_drop_combinations(adds: list[dict[str, Any]],
         List of combined action items
     """
     combined_items = []
-    used_adds = set()
-    used_drops = set()
-
-    # Try to pair drops with adds - O(n*m) instead of O(n²)
-    for i, drop_item in enumerate(drops):
-        if i in used_drops:
-            continue
-        for j, add_item in enumerate(adds):
-            if j in used_adds:
-                continue
-            # Found a pair - process immediately
-            used_adds.add(j)
-            used_drops.add(i)
-
-            is_waiver_claim = "waiver" in add_item["action"].lower()
-
-            if is_waiver_claim:
-                player_text = (f"Dropped <strong>{drop_item['player']}</strong> "
-                              f"to claim <strong>{add_item['player']}</strong> "
-                              f"for ${add_item['bid']}")
-            else:
-                player_text = (f"Dropped <strong>{drop_item['player']}</strong> "
-                              f"for <strong>{add_item['player']}</strong>")
-
-            # Use helper function for player info
-            added_player_info = _extract_player_info_from_dict(add_item)
-            dropped_player_info = _extract_player_info_from_dict(drop_item)
-
-            combined = {
-                "when_utc": ts_utc,
-                "team": add_item["team"],
-                "player": player_text,
-                "bid": (add_item["bid"] if is_waiver_claim
-                       else max(add_item["bid"], drop_item["bid"])),
-                "action_type": "Combined",
-                "added_player": added_player_info,
-                "dropped_player": dropped_player_info
-            }
-            combined_items.append(combined)
-            break
 
-    # Handle remaining unpaired items - use generators to avoid memory copies
-    remaining_adds = (adds[i] for i in range(len(adds)) if i not in used_adds)
-    remaining_drops = (drops[i] for i in range(len(drops)) if i not in used_drops)
+    # Drops and adds within one transaction pair up in order, so a single
+    # zip does the pairing in O(n) with no used-index bookkeeping
+    for drop_item, add_item in zip(drops, adds):
+        is_waiver_claim = "waiver" in add_item.action
 
-    # Process remaining adds
-    for item in remaining_adds:
-        formatted_action = format_individual_action(item)
-        combined_item = {
-            "when_utc": item["when_utc"],
-            "team": item["team"],
-            "player": formatted_action,
-            "bid": item["bid"],
+        if is_waiver_claim:
+            player_text = (f"Dropped <strong>{drop_item.player}</strong> "
+                          f"to claim <strong>{add_item.player}</strong> "
+                          f"for ${add_item.bid}")
+        else:
+            player_text = (f"Dropped <strong>{drop_item.player}</strong> "
+                          f"for <strong>{add_item.player}</strong>")
+
+        # Use helper function for player info
+        added_player_info = _extract_player_info_from_item(add_item)
+        dropped_player_info = _extract_player_info_from_item(drop_item)
+
+        combined = {
+            "when_utc": ts_utc,
+            "team": add_item.team,
+            "player": player_text,
+            "bid": (add_item.bid if is_waiver_claim
+                   else max(add_item.bid, drop_item.bid)),
             "action_type": "Combined",
-            "added_player": _extract_player_info_from_dict(item),
-            "dropped_player": {
-                "player_id": None,
-                "position": "",
-                "pro_team": "",
-                "name": ""
-            }
+            "added_player": added_player_info,
+            "dropped_player": dropped_player_info
         }
-        combined_items.append(combined_item)
+        combined_items.append(combined)
+
+    # Whatever zip didn't consume is unpaired; at most one of these slices
+    # is non-empty
+    paired = min(len(adds), len(drops))
+
+    # Process remaining adds
+    for item in adds[paired:]:
+        combined_items.append(_make_individual_combined(item, is_drop=False))
 
     # Process remaining drops
-    for item in remaining_drops:
-        formatted_action = format_individual_action(item)
-        combined_item = {
-            "when_utc": item["when_utc"],
-            "team": item["team"],
-            "player": formatted_action,
-            "bid": item["bid"],
-            "action_type": "Combined",
-            "added_player": {
-                "player_id": None,
-                "position": "",
-                "pro_team": "",
-                "name": ""
-            },
-            "dropped_player": _extract_player_info_from_dict(item)
-        }
-        combined_items.append(combined_item)
+    for item in drops[paired:]:
+        combined_items.append(_make_individual_combined(item, is_drop=True))
 
     return combined_items
 
 
-def _process_trades(trades: list[dict[str, Any]], ts_utc: datetime) -> list[dict[str, Any]]:
+def _process_trades(trades: list[ActivityItem], ts_utc: datetime) -> list[dict[str, Any]]:
     """Process trade actions and return combined trade items for each team.
 
     Args:
@@ -346,23 +393,22 @@ def _process_trades(trades: list[dict[str, Any]], ts_utc: datetime) -> list[dict
         trade = trades[0]
         return [{
             "when_utc": ts_utc,
-            "team": trade["team"],
-            "player": f"Traded <strong>{trade['player']}</strong>",
-            "bid": trade["bid"],
+            "team": trade.team,
+            "player": f"Traded <strong>{trade.player}</strong>",
+            "bid": trade.bid,
             "action_type": "Combined",
-            "added_player": _extract_player_info_from_dict(trade),
-            "dropped_player": {
-                "player_id": None,
-                "position": "",
-                "pro_team": "",
-                "name": ""
-            }
+            "added_player": _extract_player_info_from_item(trade),
+            "dropped_player": _EMPTY_PLAYER
         }]
 
-    # Group trades by team - ESPN only supports two-team trades
-    team_trades = defaultdict(list)
-    for trade in trades:
-        team_trades[trade["team"]].append(trade)
+    # Group trades by team - ESPN only supports two-team trades. The common
+    # one-player-each-way case builds the grouping directly.
+    if len(trades) == 2 and trades[0].team != trades[1].team:
+        team_trades = {trades[0].team: [trades[0]], trades[1].team: [trades[1]]}
+    else:
+        team_trades = defaultdict(list)
+        for trade in trades:
+            team_trades[trade.team].append(trade)
 
     # Get the two teams involved
     teams = list(team_trades.keys())
@@ -372,74 +418,66 @@ def _process_trades(trades: list[dict[str, Any]], ts_utc: datetime) -> list[dict
     else:
         team1, team2 = teams
 
-    # Get players for each team
-    team1_players = [f"<strong>{t['player']}</strong>" for t in team_trades[team1]]
-    team2_players = [f"<strong>{t['player']}</strong>" for t in team_trades[team2]]
+    # Join each side's player list once; both trade texts reuse both sides
+    team1_players = ", ".join(f"<strong>{t.player}</strong>" for t in team_trades[team1])
+    team2_players = ", ".join(f"<strong>{t.player}</strong>" for t in team_trades[team2])
+
+    # Both entries carry the same bid; walk the trades once
+    max_bid = max(t.bid for t in trades)
 
     # Create trade entries for both teams
     trade_items = []
 
     # Team 1 entry (what they gave up for what they received)
-    team1_trade_text = f"Traded {', '.join(team1_players)} for {', '.join(team2_players)}"
+    team1_trade_text = f"Traded {team1_players} for {team2_players}"
     trade_items.append({
         "when_utc": ts_utc,
         "team": team1,
         "player": team1_trade_text,
-        "bid": max(t["bid"] for t in trades),
+        "bid": max_bid,
         "action_type": "Combined",
-        "added_player": _extract_player_info_from_dict(team_trades[team1][0]),
-        "dropped_player": {
-            "player_id": None,
-            "position": "",
-            "pro_team": "",
-            "name": ""
-        }
+        "added_player": _extract_player_info_from_item(team_trades[team1][0]),
+        "dropped_player": _EMPTY_PLAYER
     })
 
     # Team 2 entry (what they gave up for what they received)
-    team2_trade_text = f"Traded {', '.join(team2_players)} for {', '.join(team1_players)}"
+    team2_trade_text = f"Traded {team2_players} for {team1_players}"
     trade_items.append({
         "when_utc": ts_utc,
         "team": team2,
         "player": team2_trade_text,
-        "bid": max(t["bid"] for t in trades),
+        "bid": max_bid,
         "action_type": "Combined",
-        "added_player": _extract_player_info_from_dict(team_trades[team2][0]),
-        "dropped_player": {
-            "player_id": None,
-            "position": "",
-            "pro_team": "",
-            "name": ""
-        }
+        "added_player": _extract_player_info_from_item(team_trades[team2][0]),
+        "dropped_player": _EMPTY_PLAYER
     })
 
     return trade_items
 
 
-def _process_single_activity(act: Any, since_utc: datetime) -> list[dict[str, Any]]:
+def _process_single_activity(act: Any, since_ms: int) -> list[dict[str, Any]]:
     """Process a single activity and return combined items.
 
     Args:
         act: Activity object from ESPN API
-        since_utc: UTC timestamp to filter activities
+        since_ms: Epoch milliseconds cutoff to filter activities
 
     Returns:
         List of combined action items
     """
-    ts_utc = datetime.fromtimestamp(act.date / 1000, tz=timezone.utc)
-    if ts_utc < since_utc:
+    # Filter on the raw epoch-ms integer; most of a 300-activity fetch is
+    # older than the lookback window, so skip the datetime construction
+    # for those entirely
+    if act.date < since_ms:
         return []
+    ts_utc = datetime.fromtimestamp(act.date / 1000, tz=timezone.utc)
 
     actions = getattr(act, "actions", []) or []
     if not actions:
         return []
 
     # Process and categorize actions
-    categorized = _process_activity_actions(actions, ts_utc)
-    adds = categorized["adds"]
-    drops = categorized["drops"]
-    trades = categorized["trades"]
-    other_actions = categorized["other"]
+    adds, drops, trades, other_actions = _process_activity_actions(actions, ts_utc)
 
     # Process transactions based on type
     if adds and drops:
@@ -448,40 +486,32 @@ def _process_single_activity(act: Any, since_utc: datetime) -> list[dict[str, An
         return _process_trades(trades, ts_utc)
 
     # Handle individual actions
-    combined_items = []
-    for item in adds + drops + other_actions:
-        formatted_action = format_individual_action(item)
-        # For individual actions, determine if it's an add or drop
-        is_drop = "Dropped" in formatted_action or "drop" in item.get("action", "").lower()
-
-        combined_item = {
-            "when_utc": item["when_utc"],
-            "team": item["team"],
-            "player": formatted_action,
-            "bid": item["bid"],
-            "action_type": "Combined",
-            "added_player": _extract_player_info_from_dict(item) if not is_drop else {
-                "player_id": None,
-                "position": "",
-                "pro_team": "",
-                "name": ""
-            },
-            "dropped_player": _extract_player_info_from_dict(item) if is_drop else {
-                "player_id": None,
-                "position": "",
-                "pro_team": "",
-                "name": ""
-            }
-        }
-        combined_items.append(combined_item)
-    return combined_items
+    return [_make_individual_combined(item)
+            for item in chain(adds, drops, other_actions)]
+
 
+# The ESPN fetch dominates wall-clock time, and nothing changes on ESPN's
+# side for minutes at a time; repeat runs inside this window (debug
+# iterations, template tweaks) reuse the pickled response instead.
+_ACTIVITY_CACHE_TTL = 300  # seconds
+_ACTIVITY_CACHE_DIR = Path.home() / ".cache" / "espn-ff-digest"
 
-def _fetch_activity_with_retry(league: League,
+def _activity_cache_path(league: "League") -> Path | None:
+    """Return the cache file for this league's activity fetch, if keyable."""
+    league_id = getattr(league, "league_id", None)
+    if league_id is None:
+        return None
+    key = hashlib.sha1(f"{league_id}:{getattr(league, 'year', '')}:300".encode()).hexdigest()
+    return _ACTIVITY_CACHE_DIR / f"{key}.pkl"
+
+def _fetch_activity_with_retry(league: "League",
                               max_retries: int = 3,
                               delay: float = 1.0) -> list[Any]:
     """Fetch league activity with retry logic for robustness.
 
+    Recent responses are cached on disk for a few minutes so repeat runs
+    in quick succession skip the network round-trip entirely.
+
     Args:
         league: League instance
         max_retries: Maximum number of retry attempts
@@ -493,11 +523,27 @@ def _fetch_activity_with_retry(league: League,
     Raises:
         RuntimeError: If all retry attempts fail
     """
+    cache_path = _activity_cache_path(league)
+    if cache_path is not None:
+        try:
+            if time.time() - cache_path.stat().st_mtime < _ACTIVITY_CACHE_TTL:
+                with cache_path.open("rb") as f:
+                    return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            pass  # missing/stale/corrupt cache -> fetch normally
+
     last_error = None
 
     for attempt in range(max_retries + 1):
         try:
             raw_activity = league.recent_activity(size=300)
+            if cache_path is not None:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    with cache_path.open("wb") as f:
+                        pickle.dump(raw_activity, f, protocol=pickle.HIGHEST_PROTOCOL)
+                except (OSError, pickle.PickleError, AttributeError, TypeError):
+                    pass  # caching is best-effort
             return raw_activity
         except Exception as e:
             last_error = e
@@ -509,47 +555,68 @@ def _fetch_activity_with_retry(league: League,
 
     raise RuntimeError(f"Failed to fetch activity after {max_retries + 1} attempts: {last_error}")
 
-def get_activity_since(league: League, since_utc: datetime) -> dict[str, list[dict[str, Any]]]:
+def get_activity_since(league: "League", since_utc: datetime) -> dict[str, list[dict[str, Any]]]:
     """Fetch and process league activity since the given UTC datetime."""
-    grouped: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    # Everything lands in the single "Combined" category, so collect into a
+    # plain list and wrap it on return
+    combined: list[dict[str, Any]] = []
 
     # Fetch recent activity with retry logic
     try:
         raw_activity = _fetch_activity_with_retry(league)
     except RuntimeError as e:
         print(f"Error fetching activity: {e}")
-        return grouped
+        return {"Combined": combined}
+
+    # Nothing fetched means nothing to dump, filter, or sort
+    if not raw_activity:
+        return {"Combined": combined}
 
     if debug():
         _debug_dump_activity(raw_activity)
 
-    # Process activities
+    # Process activities, filtering on epoch milliseconds (see
+    # _process_single_activity). recent_activity requests the feed sorted
+    # newest-first (sortMessageDate, sortAsc=False), so the first activity
+    # older than the cutoff ends the scan.
+    since_ms = int(since_utc.timestamp() * 1000)
     for act in raw_activity:
-        if combined_items := _process_single_activity(act, since_utc):
-            grouped["Combined"].extend(combined_items)
-
-    def _get_sort_key(item: dict[str, Any]) -> tuple[datetime, int, str, str]:
-        """Get sort key for activity items to avoid repeated lookups."""
-        return (item["when_utc"], -item.get("bid", 0), item["team"], item["player"])
+        if act.date < since_ms:
+            break
+        if combined_items := _process_single_activity(act, since_ms):
+            combined.extend(combined_items)
 
-    for cat in grouped:
-        grouped[cat].sort(key=_get_sort_key)
-    return grouped
+    # Overall order is (when_utc asc, bid desc, team, player). itemgetter
+    # can't negate the bid, so three stable C-level sorts from least to most
+    # significant key produce the same ordering without a Python-level key
+    # function.
+    combined.sort(key=_SORT_TIEBREAK)
+    combined.sort(key=_SORT_BID, reverse=True)
+    combined.sort(key=_SORT_WHEN)
+    return {"Combined": combined}
 
 
 def _debug_dump_activity(raw_activity: list[Any]) -> None:
-    """Dump raw activity data to debug file when DEBUG is enabled."""
+    """Dump raw activity data to debug file when DEBUG is enabled.
+
+    The full-object/type/dir lines are only useful when poking at the API
+    shape, so they're gated behind DEBUG_VERBOSE; the default dump keeps
+    just the date and actions per activity.
+    """
+    verbose = debug_verbose()
     debug_file = Path("debug_espn_raw.txt")
-    with open(debug_file, "w", encoding="utf-8") as f:
-        f.write(f"Raw ESPN API output (size={len(raw_activity)}):\n\n")
-        for i, act in enumerate(raw_activity):
-            f.write(f"Activity {i}:\n")
-            f.write(f"  Date: {act.date}\n")
-            f.write(f"  Actions: {getattr(act, 'actions', 'None')}\n")
-            f.write(f"  Full object: {act}\n")
-            f.write(f"  Object type: {type(act)}\n")
-            f.write(f"  Object dir: {dir(act)}\n")
-            f.write("-" * 80 + "\n")
+    sep = "-" * 80 + "\n"
+    parts = [f"Raw ESPN API output (size={len(raw_activity)}):\n\n"]
+    for i, act in enumerate(raw_activity):
+        parts.append(f"Activity {i}:\n"
+                     f"  Date: {act.date}\n"
+                     f"  Actions: {getattr(act, 'actions', 'None')}\n")
+        if verbose:
+            parts.append(f"  Full object: {act}\n"
+                         f"  Object type: {type(act)}\n"
+                         f"  Object dir: {dir(act)}\n")
+        parts.append(sep)
+    debug_file.write_text("".join(parts), encoding="utf-8")
     print(f"Debug: Raw ESPN API output saved to {debug_file}")
 
 # ---------- write file ----------
@@ -561,22 +628,41 @@ def write_html_file(html: str, auto_open: bool = True) -> str:
     path = reports_dir / f"activity-{ts}.html"
     path.write_text(html, encoding="utf-8")
     if auto_open:
+        import webbrowser
         webbrowser.open(path.resolve().as_uri())
     return str(path)
 
 # ---------- main ----------
 def main():
     """Main function to generate and display league activity report."""
+    load_dotenv()  # pulls config from .env; runs before any get_env call
     lookback_hours = int(get_env(name="LOOKBACK_HOURS", required=False, default="24"))
     since_utc = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
 
-    lg = league_handle()
-    grouped = get_activity_since(lg, since_utc)
-
-    grouped_for_email = {
-        cat: [{**i, "when_local": fmt_local(i["when_utc"])} for i in items]
-        for cat, items in grouped.items()
-    }
+    # The ESPN fetch and Gmail auth are independent network round-trips;
+    # warm the Gmail service on a thread while the ESPN calls run so the
+    # two overlap instead of serializing.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if not debug():
+            from gmail_send import warm_service
+            executor.submit(warm_service)
+
+        lg = league_handle()
+        grouped = get_activity_since(lg, since_utc)
+
+    # grouped isn't used again after rendering, so annotate the items in
+    # place instead of copy-constructing every dict. All items within one
+    # transaction share the same when_utc, so cache the formatted string
+    # per unique timestamp.
+    local_cache: dict[datetime, str] = {}
+    for items in grouped.values():
+        for i in items:
+            key = i["when_utc"]
+            when_local = local_cache.get(key)
+            if when_local is None:
+                when_local = local_cache[key] = fmt_local(key)
+            i["when_local"] = when_local
+    grouped_for_email = grouped
 
     central_now = datetime.now().astimezone(CENTRAL_TIME)
     window_desc = (f"(last {lookback_hours}h ending "
@@ -588,6 +674,7 @@ def main():
         out = write_html_file(email_html, auto_open=True)
         print(f"Wrote: {out}")
     else:
+        from gmail_send import send_gmail_html
         send_gmail_html(f"Daily Digest for ESPN Fantasy Football League: "
                        f"{lg.settings.name}", email_html)
         print("Successfully sent email.")
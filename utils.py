@@ -3,6 +3,7 @@
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from dateutil import tz
@@ -10,7 +11,16 @@ from dateutil import tz
 # Always display times in US Central Time (handles CST/CDT automatically)
 CENTRAL_TIME = tz.gettz("America/Chicago")
 
+# Matches simple HTML tags like <strong> for plain-text extraction
+_TAG_RE = re.compile(r"<[^>]+>")
 
+# Values treated as "enabled" for boolean env vars
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+# Environment variables don't change during the process lifetime, and the
+# first call happens after load_dotenv() has run, so caching is safe.
+@lru_cache(maxsize=None)
 def get_env(name: str, required: bool = True, default: str | None = None) -> str:
     """Get environment variable with optional validation.
 
@@ -34,6 +44,7 @@ def get_env(name: str, required: bool = True, default: str | None = None) -> str
     return val
 
 
+@lru_cache(maxsize=None)
 def debug() -> bool:
     """Check if DEBUG is enabled.
 
@@ -41,14 +52,25 @@ def debug() -> bool:
         True if DEBUG environment variable is set to a truthy value
     """
     debug_val = get_env("DEBUG", default="", required=False)
-    return debug_val.lower() in {"1", "true", "yes", "on"}
+    return debug_val.lower() in _TRUTHY
+
+
+@lru_cache(maxsize=None)
+def debug_verbose() -> bool:
+    """Check if DEBUG_VERBOSE is enabled (extra detail in debug dumps).
+
+    Returns:
+        True if DEBUG_VERBOSE environment variable is set to a truthy value
+    """
+    verbose_val = get_env("DEBUG_VERBOSE", default="", required=False)
+    return verbose_val.lower() in _TRUTHY
 
 
 def strip_html_tags(text: str) -> str:
     """Remove simple HTML tags like <strong> from a string for plain-text extraction."""
     if not isinstance(text, str):
         return str(text)
-    return re.sub(r"<[^>]+>", "", text)
+    return _TAG_RE.sub("", text)
 
 
 def fmt_team(team_obj: Any) -> str:
@@ -117,11 +139,13 @@ def fmt_player(player_obj: Any) -> str:
     return str(player_obj)
 
 
+@lru_cache(maxsize=1024)
 def is_dst_player(player_name: str) -> bool:
     """Check if a player name represents a Defense/Special Teams unit."""
     return "D/ST" in player_name or "DST" in player_name
 
 
+@lru_cache(maxsize=1024)
 def get_player_headshot_url(player_id: int) -> str:
     """Get ESPN headshot URL for a player.
 
@@ -134,6 +158,7 @@ def get_player_headshot_url(player_id: int) -> str:
     return f"https://a.espncdn.com/i/headshots/nfl/players/full/{player_id}.png"
 
 
+@lru_cache(maxsize=1024)
 def get_team_logo_url(team_abbrev: str) -> str:
     """Get ESPN team logo URL.
 
@@ -148,4 +173,10 @@ def get_team_logo_url(team_abbrev: str) -> str:
 
 def fmt_local(dt_utc: datetime) -> str:
     """Format UTC datetime to local time string."""
-    return dt_utc.astimezone(CENTRAL_TIME).strftime("%Y-%m-%d %I:%M %p")
+    # Equivalent to strftime("%Y-%m-%d %I:%M %p") without re-parsing the
+    # format string and walking the locale machinery on every call
+    dt = dt_utc.astimezone(CENTRAL_TIME)
+    hour = dt.hour
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{(hour - 1) % 12 + 1:02d}:{dt.minute:02d} "
+            f"{'AM' if hour < 12 else 'PM'}")